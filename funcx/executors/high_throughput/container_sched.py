@@ -35,7 +35,7 @@ def naive_scheduler(task_qs, max_workers, old_worker_map, to_die_list, logger):
     for q_type in task_qs:
         if q_type not in blocked_types:
             q_types.append(q_type)
-            q_size = task_qs[q_type].qsize()
+            q_size = len(task_qs[q_type])
             sum_q_size += q_size
             q_sizes[q_type] = q_size
 
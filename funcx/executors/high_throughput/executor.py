@@ -11,6 +11,7 @@ import threading
 import queue
 import pickle
 import daemon
+import zmq
 from multiprocessing import Process, Queue
 
 #from ipyparallel.serialize import pack_apply_message  # ,unpack_apply_message
@@ -258,9 +259,15 @@ class HighThroughputExecutor(ParslExecutor, RepresentationMixin):
     def start(self):
         """Create the Interchange process and connect to it.
         """
-        self.outgoing_q = zmq_pipes.TasksOutgoing("0.0.0.0", self.interchange_port_range)
-        self.incoming_q = zmq_pipes.ResultsIncoming("0.0.0.0", self.interchange_port_range)
-        self.command_client = zmq_pipes.CommandClient("0.0.0.0", self.interchange_port_range)
+        # All three pipes share one context so only a single ZMQ IO thread
+        # pool is spun up for the executor
+        self.zmq_context = zmq.Context()
+        self.outgoing_q = zmq_pipes.TasksOutgoing("0.0.0.0", self.interchange_port_range,
+                                                  context=self.zmq_context)
+        self.incoming_q = zmq_pipes.ResultsIncoming("0.0.0.0", self.interchange_port_range,
+                                                    context=self.zmq_context)
+        self.command_client = zmq_pipes.CommandClient("0.0.0.0", self.interchange_port_range,
+                                                      context=self.zmq_context)
 
         self.is_alive = True
 
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
+import collections
 import logging
 import os
+import socket
 import sys
 import platform
 import threading
@@ -13,9 +15,15 @@ import uuid
 import zmq
 import math
 import json
+import msgpack
 import multiprocessing
 import psutil
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:     # Python < 3.8
+    shared_memory = None
+
 from funcx.executors.high_throughput.container_sched import naive_scheduler
 from funcx.executors.high_throughput.worker_map import WorkerMap
 from funcx.serialize import FuncXSerializer
@@ -29,6 +37,82 @@ from funcx import set_file_logger
 RESULT_TAG = 10
 TASK_REQUEST_TAG = 11
 HEARTBEAT_CODE = (2 ** 32) - 1
+HEARTBEAT_BYTES = HEARTBEAT_CODE.to_bytes(4, "little")
+
+
+def cgroup_cpu_count():
+    """ CPU count as constrained by cgroups / scheduler affinity.
+
+    multiprocessing.cpu_count() reports host-wide cores, which oversizes
+    the worker pool when the manager runs in a cgroup-limited allocation
+    (Slurm, Kubernetes) and leads to heavy oversubscription. Prefer the
+    cgroup v2 quota, then the affinity mask (which honors taskset and
+    cpuset limits), then the host count.
+    """
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            return max(1, int(quota) // int(period))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
+def available_mem_on_node():
+    """ Available memory in GB, honoring a cgroup v2 memory limit if one
+    is set.
+    """
+    available = psutil.virtual_memory().available
+    try:
+        with open('/sys/fs/cgroup/memory.max') as f:
+            limit = f.read().strip()
+        if limit != 'max':
+            with open('/sys/fs/cgroup/memory.current') as f:
+                current = int(f.read())
+            available = min(available, max(0, int(limit) - current))
+    except (OSError, ValueError):
+        pass
+    return round(available / (2**30), 1)
+
+
+def tune_socket(sock, immediate=True):
+    """ Apply tuned options to a task/result stream socket.
+
+    Keepalives detect dead peers, and larger kernel buffers keep the
+    task/result streams from hitting the default buffer ceiling at high
+    rates. IMMEDIATE is only meaningful on connecting sockets; it drops
+    messages bound for disconnected peers instead of queueing them.
+    """
+    sock.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    sock.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 30)
+    sock.setsockopt(zmq.SNDBUF, 8 << 20)
+    sock.setsockopt(zmq.RCVBUF, 8 << 20)
+    if immediate:
+        sock.setsockopt(zmq.IMMEDIATE, 1)
+
+
+class WakeableEvent(threading.Event):
+    """ A threading.Event that also wakes a thread blocked in a poller.
+
+    set() writes a byte to the write end of a socketpair whose read end is
+    registered with the poller, so the polling thread observes the event
+    immediately instead of at its next poll timeout.
+    """
+
+    def __init__(self, wake_sock):
+        super().__init__()
+        self._wake_sock = wake_sock
+
+    def set(self):
+        super().set()
+        try:
+            self._wake_sock.send(b'x')
+        except OSError:
+            pass
 
 
 class Manager(object):
@@ -111,12 +195,41 @@ class Manager(object):
 
         logger.info("Manager started")
 
-        self.context = zmq.Context()
+        self.cores_on_node = cgroup_cpu_count()
+
+        # On larger Linux nodes, reserve two cores for the manager's own
+        # threads (dispatch loop + ZMQ IO) and keep workers on the rest, so
+        # worker processes don't introduce scheduling jitter on the dispatch
+        # path. The split comes from the actual affinity mask: inside a
+        # cpuset/taskset allocation the usable core indices are arbitrary,
+        # so index ranges derived from a core *count* would be wrong.
+        # Pinning must happen before the ZMQ context is created, since
+        # sched_setaffinity only affects the calling thread and threads
+        # spawned afterwards. Small allocations are left alone.
+        self.manager_cpu_affinity = None
+        self.worker_cpu_affinity = None
+        if hasattr(os, 'sched_setaffinity'):
+            usable_cores = sorted(os.sched_getaffinity(0))
+            if len(usable_cores) > 4:
+                manager_cores = set(usable_cores[-2:])
+                try:
+                    os.sched_setaffinity(0, manager_cores)
+                except OSError:
+                    logger.warning("Could not pin manager to cores: {}".format(sorted(manager_cores)))
+                else:
+                    logger.info("Manager pinned to cores: {}".format(sorted(manager_cores)))
+                    self.manager_cpu_affinity = manager_cores
+                    self.worker_cpu_affinity = set(usable_cores[:-2])
+
+        # One context shared by all three sockets; size the IO thread pool
+        # with the node so a single IO thread doesn't cap worker fan-in
+        self.context = zmq.Context(io_threads=max(2, self.cores_on_node // 4))
         self.task_incoming = self.context.socket(zmq.DEALER)
         self.task_incoming.setsockopt(zmq.IDENTITY, uid.encode('utf-8'))
         # Linger is set to 0, so that the manager can exit even when there might be
         # messages in the pipe
         self.task_incoming.setsockopt(zmq.LINGER, 0)
+        tune_socket(self.task_incoming)
         self.task_incoming.connect(task_q_url)
 
         self.logdir = logdir
@@ -125,6 +238,7 @@ class Manager(object):
         self.result_outgoing = self.context.socket(zmq.DEALER)
         self.result_outgoing.setsockopt(zmq.IDENTITY, uid.encode('utf-8'))
         self.result_outgoing.setsockopt(zmq.LINGER, 0)
+        tune_socket(self.result_outgoing)
         self.result_outgoing.connect(result_q_url)
         logger.info("Manager connected")
 
@@ -132,10 +246,9 @@ class Manager(object):
 
         self.mode = mode
         self.container_image = container_image
-        self.cores_on_node = multiprocessing.cpu_count()
         self.max_workers = max_workers
         self.cores_per_workers = cores_per_worker
-        self.available_mem_on_node = round(psutil.virtual_memory().available / (2**30), 1)
+        self.available_mem_on_node = available_mem_on_node()
         self.worker_count = min(max_workers,
                                 math.floor(self.cores_on_node / cores_per_worker))
         self.worker_map = WorkerMap(self.worker_count)
@@ -143,7 +256,12 @@ class Manager(object):
         self.internal_worker_port_range = internal_worker_port_range
 
         self.funcx_task_socket = self.context.socket(zmq.ROUTER)
-        self.funcx_task_socket.set_hwm(0)
+        # A bounded HWM provides backpressure on the zero-copy dispatch path;
+        # an unlimited HWM lets unacked frames pile up until the socket wedges
+        # (see the ~10k in-flight note in zmq_pipes.TasksOutgoing). Dispatch is
+        # paced by ready workers, so this bound is never hit in practice.
+        self.funcx_task_socket.set_hwm(1024)
+        tune_socket(self.funcx_task_socket, immediate=False)
         self.address = '127.0.0.1'
         self.worker_port = self.funcx_task_socket.bind_to_random_port(
             "tcp://*",
@@ -152,9 +270,16 @@ class Manager(object):
 
         logger.info("Manager listening on {} port for incoming worker connections".format(self.worker_port))
 
-        self.task_queues = {'RAW': queue.Queue()}
+        # Task queues are only ever touched by the pull_tasks thread, so a
+        # plain deque avoids queue.Queue's mutex and condition variable
+        self.task_queues = {'RAW': collections.deque()}
 
-        self.pending_result_queue = multiprocessing.Queue()
+        # Results are handed from the pull_tasks thread to the push_results
+        # thread in-process. A deque (append/popleft are atomic under the GIL)
+        # plus an Event avoids the pipe + pickle + feeder-thread cost of a
+        # multiprocessing.Queue.
+        self.pending_result_queue = collections.deque()
+        self._result_event = threading.Event()
 
         self.max_queue_size = max_queue_size + self.worker_count
         self.tasks_per_round = 1
@@ -165,6 +290,15 @@ class Manager(object):
         self.serializer = FuncXSerializer()
         self.next_worker_q = []  # FIFO queue for spinning up workers.
 
+        # Wake-up pipe for the pull_tasks poller, so setting the kill event
+        # interrupts a blocked poll instead of waiting out its timeout
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+
+        # Task-request counts are sent every tick; precompute their byte
+        # encodings so the hot loop does a list index instead of to_bytes
+        self._count_bytes = [i.to_bytes(4, "little") for i in range(self.worker_count * 4 + 1)]
+
     def create_reg_message(self):
         """ Creates a registration message to identify the worker to the interchange
         """
@@ -186,9 +320,8 @@ class Manager(object):
     def heartbeat(self):
         """ Send heartbeat to the incoming task queue
         """
-        heartbeat = (HEARTBEAT_CODE).to_bytes(4, "little")
-        r = self.task_incoming.send(heartbeat)
-        logger.debug("Return from heartbeat: {}".format(r))
+        r = self.task_incoming.send(HEARTBEAT_BYTES)
+        logger.debug("Return from heartbeat: %s", r)
 
     def pull_tasks(self, kill_event):
         """ Pull tasks from the incoming tasks 0mq pipe onto the internal
@@ -213,107 +346,201 @@ class Manager(object):
         poller = zmq.Poller()
         poller.register(self.task_incoming, zmq.POLLIN)
         poller.register(self.funcx_task_socket, zmq.POLLIN)
+        wake_fd = self._wake_r.fileno()
+        poller.register(wake_fd, zmq.POLLIN)
 
         # Send a registration message
         msg = self.create_reg_message()
         logger.debug("Sending registration message: {}".format(msg))
         self.task_incoming.send(msg)
-        last_beat = time.time()
-        last_interchange_contact = time.time()
+        # The monotonic clock is cheaper than time.time() and immune to
+        # wall-clock jumps; it is sampled once per loop phase below rather
+        # than per comparison
+        last_beat = time.monotonic()
+        last_interchange_contact = time.monotonic()
         task_recv_counter = 0
         task_done_counter = 0
 
         poll_timer = self.poll_period
 
         new_worker_map = None
+        # Only run the task/worker matching pass when something changed;
+        # on idle ticks the loop skips straight back to the poller
+        dispatch_needed = True
+        # Scheduling is the most allocation-heavy part of an iteration, so it
+        # runs only when task/worker state changed, and at most every 100 ms
+        sched_dirty = True
+        last_sched = 0.0
         while not kill_event.is_set():
             # Disabling the check on ready_worker_queue disables batching
             logger.debug("[TASK_PULL_THREAD] Loop start")
             pending_task_count = task_recv_counter - task_done_counter
             ready_worker_count = self.worker_map.ready_worker_count()
-            logger.debug("[TASK_PULL_THREAD pending_task_count: {} Ready_worker_count: {}".format(
-                pending_task_count, ready_worker_count))
+            logger.debug("[TASK_PULL_THREAD pending_task_count: %s Ready_worker_count: %s",
+                         pending_task_count, ready_worker_count)
 
-            if time.time() > last_beat + self.heartbeat_period:
+            now = time.monotonic()
+            if now > last_beat + self.heartbeat_period:
                 self.heartbeat()
-                last_beat = time.time()
+                last_beat = now
 
             if pending_task_count < self.max_queue_size and ready_worker_count > 0:
-                logger.debug("[TASK_PULL_THREAD] Requesting tasks: {}".format(ready_worker_count))
-                msg = (ready_worker_count.to_bytes(4, "little"))
+                logger.debug("[TASK_PULL_THREAD] Requesting tasks: %s", ready_worker_count)
+                if ready_worker_count < len(self._count_bytes):
+                    msg = self._count_bytes[ready_worker_count]
+                else:
+                    msg = ready_worker_count.to_bytes(4, "little")
                 self.task_incoming.send(msg)
 
             # Receive results from the workers, if any
-            socks = dict(poller.poll(timeout=poll_timer))
-            if self.funcx_task_socket in socks and socks[self.funcx_task_socket] == zmq.POLLIN:
-                try:
-                    w_id, m_type, message = self.funcx_task_socket.recv_multipart()
-                    if m_type == b'REGISTER':
-                        reg_info = pickle.loads(message)
-                        logger.debug("Registration received from worker:{} {}".format(w_id, reg_info))
-
-                        # Increment worker_type count by 1
-                        self.worker_map.pending_workers -= 1
-                        self.worker_map.active_workers += 1
-                        self.worker_map.register_worker(w_id, reg_info['worker_type'])
-
-                    elif m_type == b'TASK_RET':
-                        logger.debug("Result received from worker: {}".format(w_id))
-                        logger.debug("[TASK_PULL_THREAD] Got result: {}".format(message))
-                        self.pending_result_queue.put(message)
-                        self.worker_map.put_worker(w_id)
-                        task_done_counter += 1
-
-                    elif m_type == b'WRKR_DIE':
-                        logger.debug("[WORKER_REMOVE] Removing worker from worker_map...")
-                        logger.debug("Ready worker counts: {}".format(self.worker_map.ready_worker_type_counts))
-                        logger.debug("Total worker counts: {}".format(self.worker_map.total_worker_type_counts))
-                        self.worker_map.remove_worker(w_id)
-
-                except Exception as e:
-                    logger.warning("[TASK_PULL_THREAD] FUNCX : caught {}".format(e))
-
-            # Spin up any new workers according to the worker queue.
-            # Returns the total number of containers that have spun up.
-            spin_up = self.worker_map.spin_up_workers(self.next_worker_q,
-                                                      debug=self.debug,
-                                                      address=self.address,
-                                                      uid=self.uid,
-                                                      logdir=self.logdir,
-                                                      worker_port=self.worker_port)
-            logger.debug("[SPIN UP]: Spun up {} containers".format(spin_up))
+            # Use the list form of poll and plain event masks; building a dict
+            # per 10 ms tick is wasted allocation with only two sockets registered
+            task_incoming_events = 0
+            worker_socket_events = 0
+            for sock, mask in poller.poll(timeout=poll_timer):
+                if sock is self.task_incoming:
+                    task_incoming_events = mask
+                elif sock is self.funcx_task_socket:
+                    worker_socket_events = mask
+                elif sock == wake_fd:
+                    # Drain the wakeup byte; the loop condition re-checks
+                    # kill_event on its own
+                    try:
+                        self._wake_r.recv(64)
+                    except OSError:
+                        pass
+
+            if worker_socket_events & zmq.POLLIN:
+                # Drain everything queued on the worker socket in one wake:
+                # at start-up N workers register nearly simultaneously, and
+                # handling one message per poll would serialize that warm-up
+                while True:
+                    try:
+                        frames = self.funcx_task_socket.recv_multipart(zmq.NOBLOCK, copy=False)
+                    except zmq.Again:
+                        break
+
+                    try:
+                        # The socket is bound on tcp://*, so a malformed or
+                        # foreign peer must not be able to kill this thread
+                        if len(frames) != 3:
+                            logger.warning("[TASK_PULL_THREAD] Dropping malformed worker message"
+                                           " with %s frames", len(frames))
+                            continue
+
+                        # copy=False leaves each frame in its zmq-owned buffer;
+                        # only the small routing/type frames are materialized as
+                        # bytes, and result bodies are forwarded as frames without
+                        # ever being copied into fresh bytes objects
+                        w_id = frames[0].bytes
+                        m_type = frames[1].bytes
+                        message = frames[2]
+
+                        if m_type == b'REGISTER':
+                            reg_info = msgpack.unpackb(message.bytes, raw=False)
+                            logger.debug("Registration received from worker:%s %s", w_id, reg_info)
+
+                            # Increment worker_type count by 1
+                            self.worker_map.pending_workers -= 1
+                            self.worker_map.active_workers += 1
+                            self.worker_map.register_worker(w_id, reg_info['worker_type'])
+                            dispatch_needed = True
+                            sched_dirty = True
+
+                        elif m_type == b'TASK_RET':
+                            logger.debug("Result received from worker: %s", w_id)
+                            logger.debug("[TASK_PULL_THREAD] Got result: %s", message)
+                            self.pending_result_queue.append(message)
+                            self._result_event.set()
+                            self.worker_map.put_worker(w_id)
+                            task_done_counter += 1
+                            dispatch_needed = True
+                            sched_dirty = True
+
+                        elif m_type == b'TASK_RET_SHM':
+                            # Large result body; the message is only a descriptor
+                            # for a shared-memory block written by the worker
+                            desc = msgpack.unpackb(message.bytes, raw=False)
+                            logger.debug("Result received from worker: %s via shm:%s", w_id, desc['name'])
+                            shm = shared_memory.SharedMemory(name=desc['name'])
+                            try:
+                                self.pending_result_queue.append(bytes(shm.buf[:desc['len']]))
+                            finally:
+                                shm.close()
+                                shm.unlink()
+                            self._result_event.set()
+                            self.worker_map.put_worker(w_id)
+                            task_done_counter += 1
+                            dispatch_needed = True
+                            sched_dirty = True
+
+                        elif m_type == b'WRKR_DIE':
+                            logger.debug("[WORKER_REMOVE] Removing worker from worker_map...")
+                            logger.debug("Ready worker counts: %s", self.worker_map.ready_worker_type_counts)
+                            logger.debug("Total worker counts: %s", self.worker_map.total_worker_type_counts)
+                            self.worker_map.remove_worker(w_id)
+                            sched_dirty = True
+
+                    except Exception as e:
+                        logger.warning("[TASK_PULL_THREAD] FUNCX : caught %s", e)
+
+            # Spin up any new workers according to the worker queue; nothing
+            # to do when the queue is empty.
+            if self.next_worker_q:
+                spin_up = self.worker_map.spin_up_workers(self.next_worker_q,
+                                                          debug=self.debug,
+                                                          address=self.address,
+                                                          uid=self.uid,
+                                                          logdir=self.logdir,
+                                                          worker_port=self.worker_port,
+                                                          cpu_affinity=self.worker_cpu_affinity)
+                logger.debug("[SPIN UP]: Spun up %s containers", spin_up)
 
             # Receive task batches from Interchange and forward to workers
-            if self.task_incoming in socks and socks[self.task_incoming] == zmq.POLLIN:
+            if task_incoming_events & zmq.POLLIN:
                 poll_timer = 0
-                _, pkl_msg = self.task_incoming.recv_multipart()
-                tasks = pickle.loads(pkl_msg)
-                last_interchange_contact = time.time()
+                _, raw_msg = self.task_incoming.recv_multipart()
+                last_interchange_contact = time.monotonic()
 
-                if tasks == 'STOP':
+                # Sentinels are sent as fixed byte strings so that they can be
+                # matched without paying for a deserialization first
+                if raw_msg == b'STOP':
                     logger.critical("[TASK_PULL_THREAD] Received stop request")
                     kill_event.set()
                     break
 
-                elif tasks == HEARTBEAT_CODE:
+                tasks = msgpack.unpackb(raw_msg, raw=False, use_list=False)
+
+                if tasks == HEARTBEAT_CODE:
                     logger.debug("Got heartbeat from interchange")
 
                 else:
-                    task_recv_counter += len(tasks)
-                    logger.debug("[TASK_PULL_THREAD] Got tasks: {} of {}".format([t['task_id'] for t in tasks],
-                                                                                 task_recv_counter))
-
-                    for task in tasks:
-                        # Set default type to raw
-                        task_type = task['task_id'].split(';')[1]
-
-                        logger.debug("[TASK DEBUG] Task is of type: {}".format(task_type))
+                    # Batches use a parallel-array layout: dispatch reads
+                    # straight out of these lists, with no dict per task
+                    task_ids = tasks['ids']
+                    task_types = tasks['types']
+                    buffers = tasks['bufs']
+                    task_recv_counter += len(task_ids)
+                    logger.debug("[TASK_PULL_THREAD] Got tasks: %s of %s",
+                                 task_ids, task_recv_counter)
+
+                    for i in range(len(task_ids)):
+                        task_id = task_ids[i]
+                        # The interchange tags task_type for us; the split is
+                        # only a fallback for batches from older interchanges
+                        task_type = task_types[i] or task_id.split(';', 2)[1]
+
+                        logger.debug("[TASK DEBUG] Task %s is of type: %s", task_id, task_type)
 
                         if task_type not in self.task_queues:
-                            self.task_queues[task_type] = queue.Queue()
+                            self.task_queues[task_type] = collections.deque()
                             self.worker_map.total_worker_type_counts[task_type] = 0
-                        self.task_queues[task_type].put(task)
-                        logger.debug("Task {} pushed to a task queue {}".format(task, task_type))
+                        # Wrap the serialized function buffer once at receive
+                        # time so dispatch can send it without another memcpy
+                        self.task_queues[task_type].append(
+                            (task_id, zmq.Frame(buffers[i], copy=False, track=False)))
+                    dispatch_needed = True
+                    sched_dirty = True
 
             else:
                 logger.debug("[TASK_PULL_THREAD] No incoming tasks")
@@ -324,90 +551,127 @@ class Manager(object):
                 poll_timer = min(self.heartbeat_period * 1000, poll_timer * 2)
 
                 # Only check if no messages were received.
-                if time.time() > last_interchange_contact + self.heartbeat_threshold:
+                # now is from the top of the iteration, so this errs on the
+                # conservative side by at most one poll interval
+                if now > last_interchange_contact + self.heartbeat_threshold:
                     logger.critical("[TASK_PULL_THREAD] Missing contact with interchange beyond heartbeat_threshold")
                     kill_event.set()
                     logger.critical("[TASK_PULL_THREAD] Exiting")
                     break
 
-            logger.debug("Task queues: {}".format(self.task_queues))
-            logger.debug("To-Die Counts: {}".format(self.worker_map.to_die_count))
-            logger.debug("Alive worker counts: {}".format(self.worker_map.total_worker_type_counts))
+            if sched_dirty and now - last_sched > 0.1:
+                sched_dirty = False
+                last_sched = now
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Task queues: %s", self.task_queues)
+                    logger.debug("To-Die Counts: %s", self.worker_map.to_die_count)
+                    logger.debug("Alive worker counts: %s", self.worker_map.total_worker_type_counts)
 
-            new_worker_map = naive_scheduler(self.task_queues, self.worker_count, new_worker_map, self.worker_map.to_die_count, logger=logger)
-            logger.debug("[SCHEDULER] New worker map: {}".format(new_worker_map))
+                new_worker_map = naive_scheduler(self.task_queues, self.worker_count, new_worker_map, self.worker_map.to_die_count, logger=logger)
+                logger.debug("[SCHEDULER] New worker map: %s", new_worker_map)
 
-            #  Count the workers of each type that need to be removed
-            if new_worker_map is not None:
-                spin_downs = self.worker_map.spin_down_workers(new_worker_map)
+                #  Count the workers of each type that need to be removed
+                if new_worker_map is not None:
+                    spin_downs = self.worker_map.spin_down_workers(new_worker_map)
 
-                for w_type in spin_downs:
-                    self.remove_worker_init(w_type)
+                    for w_type in spin_downs:
+                        self.remove_worker_init(w_type)
+                    if spin_downs:
+                        # KILL messages were queued and need to be dispatched
+                        dispatch_needed = True
 
-            # NOTE: Wipes the queue -- previous scheduling loops don't affect what's needed now.
-            if new_worker_map is not None:
-                self.next_worker_q = self.worker_map.get_next_worker_q(new_worker_map)
+                # NOTE: Wipes the queue -- previous scheduling loops don't affect what's needed now.
+                if new_worker_map is not None:
+                    self.next_worker_q = self.worker_map.get_next_worker_q(new_worker_map)
 
-            current_worker_map = self.worker_map.get_worker_counts()
-            for task_type in current_worker_map:
-                if task_type == 'slots':
-                    continue
+            if dispatch_needed:
+                dispatch_needed = False
 
                 # *** Match tasks to workers *** #
-                else:
+                # Bind everything the per-task loop touches to locals; at peak
+                # rates this section runs once per task and repeated attribute
+                # resolution is real interpreter overhead
+                task_queues = self.task_queues
+                worker_queues = self.worker_map.worker_queues
+                get_worker = self.worker_map.get_worker
+                put_worker = self.worker_map.put_worker
+                send_to_worker = self.funcx_task_socket.send_multipart
+                log_debug = logger.debug
+                current_worker_map = self.worker_map.get_worker_counts()
+                for task_type in current_worker_map:
+                    if task_type == 'slots':
+                        continue
+
+                    task_q = task_queues.get(task_type)
+                    if task_q is None or task_type not in worker_queues:
+                        continue
+
                     available_workers = current_worker_map[task_type]
-                    logger.debug("Available workers of type {}: {}".format(task_type,
-                                                                           available_workers))
+                    log_debug("Available workers of type %s: %s", task_type, available_workers)
 
                     for i in range(available_workers):
-                        if task_type in self.task_queues and not self.task_queues[task_type].qsize() == 0 \
-                                and not self.worker_map.worker_queues[task_type].qsize() == 0:
-
-                            logger.debug("Task type {} has task queue size {}"
-                                         .format(task_type, self.task_queues[task_type].qsize()))
-                            logger.debug("... and available workers: {}"
-                                         .format(self.worker_map.worker_queues[task_type].qsize()))
-
-                            task = self.task_queues[task_type].get()
-                            worker_id = self.worker_map.get_worker(task_type)
-
-                            logger.debug("Sending task {} to {}".format(task['task_id'], worker_id))
-                            to_send = [worker_id, pickle.dumps(task['task_id']), task['buffer']]
-                            self.funcx_task_socket.send_multipart(to_send)
-                            logger.debug("Sending complete!")
-
-    def push_results(self, kill_event, max_result_batch_size=1):
+                        try:
+                            worker_id = get_worker(task_type)
+                        except queue.Empty:
+                            break
+
+                        if not task_q:
+                            # Workers are fungible within a type, so the idle
+                            # worker can simply go back into the ready pool
+                            put_worker(worker_id)
+                            break
+                        task_id, buffer_frame = task_q.popleft()
+
+                        log_debug("Sending task %s to %s", task_id, worker_id)
+                        # task_id is a string, so a plain encode beats a pickle round-trip
+                        send_to_worker([worker_id, task_id.encode('utf-8'), buffer_frame],
+                                       copy=False)
+                        log_debug("Sending complete!")
+
+    def push_results(self, kill_event, max_result_batch_size=64):
         """ Listens on the pending_result_queue and sends out results via 0mq
 
+        Results are drained into batches of up to max_result_batch_size and
+        sent as a single multipart message to amortize ZMQ framing and
+        syscall overhead at high result rates.
+
         Parameters:
         -----------
         kill_event : threading.Event
               Event to let the thread know when it is time to die.
+
+        max_result_batch_size : int
+              Maximum number of results to pack into a single multipart message.
         """
 
         logger.debug("[RESULT_PUSH_THREAD] Starting thread")
 
         push_poll_period = max(10, self.poll_period) / 1000    # push_poll_period must be atleast 10 ms
-        logger.debug("[RESULT_PUSH_THREAD] push poll period: {}".format(push_poll_period))
+        logger.debug("[RESULT_PUSH_THREAD] push poll period: %s", push_poll_period)
 
-        last_beat = time.time()
-        items = []
+        pending_results = self.pending_result_queue
 
         while not kill_event.is_set():
-            try:
-                r = self.pending_result_queue.get(block=True, timeout=push_poll_period)
-                items.append(r)
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.exception("[RESULT_PUSH_THREAD] Got an exception: {}".format(e))
-
-            # If we have reached poll_period duration or timer has expired, we send results
-            if len(items) >= self.max_queue_size or time.time() > last_beat + push_poll_period:
-                last_beat = time.time()
-                if items:
-                    self.result_outgoing.send_multipart(items)
-                    items = []
+            # Wait for the pull_tasks thread to signal new results, then drain
+            # whatever is queued so many results go out in one send
+            self._result_event.wait(push_poll_period)
+            self._result_event.clear()
+
+            items = []
+            while pending_results and len(items) < max_result_batch_size:
+                items.append(pending_results.popleft())
+
+            if items:
+                # copy=True for small batches to steer clear of the broken-socket
+                # state seen with many untracked zero-copy sends in flight
+                # (see the note in zmq_pipes.TasksOutgoing); larger batches get
+                # the zero-copy fast path since each send retires many frames.
+                self.result_outgoing.send_multipart(items, copy=len(items) < 8)
+                if pending_results:
+                    # More than one batch was queued; skip the wait on the
+                    # next pass rather than stalling for the poll period
+                    self._result_event.set()
 
         logger.critical("[RESULT_PUSH_THREAD] Exiting")
 
@@ -422,8 +686,7 @@ class Manager(object):
 
         logger.debug("[WORKER_REMOVE] Appending KILL message to worker queue")
         self.worker_map.to_die_count[worker_type] += 1
-        self.task_queues[worker_type].put({"task_id": pickle.dumps(b"KILL"),
-                                           "buffer": b'KILL'})
+        self.task_queues[worker_type].append(("KILL", zmq.Frame(b'KILL', copy=False, track=False)))
 
     def start(self):
         """
@@ -433,7 +696,7 @@ class Manager(object):
             Forward results
         """
 
-        self.task_queues = {'RAW': queue.Queue()}  # k-v: task_type - task_q (PriorityQueue) -- default = RAW
+        self.task_queues = {'RAW': collections.deque()}  # k-v: task_type - task_q (deque) -- default = RAW
 
         self.workers = [self.worker_map.add_worker(worker_id=str(self.worker_map.worker_counter),
                                                    worker_type='RAW',
@@ -441,12 +704,13 @@ class Manager(object):
                                                    debug=self.debug,
                                                    uid=self.uid,
                                                    logdir=self.logdir,
-                                                   worker_port=self.worker_port)]
+                                                   worker_port=self.worker_port,
+                                                   cpu_affinity=self.worker_cpu_affinity)]
         self.worker_map.worker_counter += 1
         self.worker_map.pending_workers += 1
 
         logger.debug("Initial workers launched")
-        self._kill_event = threading.Event()
+        self._kill_event = WakeableEvent(self._wake_w)
         self._result_pusher_thread = threading.Thread(target=self.push_results,
                                                       args=(self._kill_event,))
         self._result_pusher_thread.start()
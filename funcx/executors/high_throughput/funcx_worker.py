@@ -5,9 +5,21 @@ import argparse
 import zmq
 import sys
 import pickle
+import msgpack
+
+try:
+    from multiprocessing import shared_memory
+    from multiprocessing import resource_tracker
+except ImportError:     # Python < 3.8
+    shared_memory = None
+    resource_tracker = None
 
 from parsl.app.errors import RemoteExceptionWrapper
 
+# Results smaller than this go inline over ZMQ; the shm setup cost only
+# pays off for large result bodies
+SHM_RESULT_THRESHOLD = 4096
+
 from funcx import set_file_logger
 from funcx.serialize import FuncXSerializer
 
@@ -88,8 +100,29 @@ class FuncXWorker(object):
 
             logger.debug("Sending result")
 
-            self.task_socket.send_multipart([task_type,  # Byte encoded
-                                             pickle.dumps(result)])
+            if task_type == b'REGISTER':
+                # Registration is a small flat dict; msgpack decodes much
+                # faster than pickle on the manager's dispatch thread
+                b_result = msgpack.packb(result)
+            else:
+                b_result = pickle.dumps(result)
+            if (task_type == b'TASK_RET' and shared_memory is not None
+                    and len(b_result) >= SHM_RESULT_THRESHOLD):
+                # Large result bodies go via shared memory; only a small
+                # descriptor crosses the socket. The manager unlinks the block.
+                shm = shared_memory.SharedMemory(create=True, size=len(b_result))
+                shm.buf[:len(b_result)] = b_result
+                descriptor = msgpack.packb({'name': shm.name, 'len': len(b_result)})
+                shm.close()
+                # Ownership transfers to the manager, which unlinks the
+                # segment after reading it. Drop it from this process's
+                # resource tracker so the tracker doesn't accumulate an
+                # entry per result and attempt stale unlinks at exit.
+                resource_tracker.unregister(shm._name, "shared_memory")
+                self.task_socket.send_multipart([b'TASK_RET_SHM', descriptor])
+            else:
+                self.task_socket.send_multipart([task_type,  # Byte encoded
+                                                 b_result])
 
             if task_type == b'WRKR_DIE':
                 logger.info("*** WORKER {} ABOUT TO DIE ***".format(self.worker_id))
@@ -97,8 +130,8 @@ class FuncXWorker(object):
                 exit()
 
             logger.debug("Waiting for task")
-            p_task_id, msg = self.task_socket.recv_multipart()
-            task_id = pickle.loads(p_task_id)
+            b_task_id, msg = self.task_socket.recv_multipart()
+            task_id = b_task_id.decode('utf-8')
             logger.debug(
                 "Received task_id:{} with task:{}".format(task_id, msg))
 
@@ -12,6 +12,7 @@ import logging
 import queue
 import threading
 import json
+import msgpack
 import daemon
 
 from parsl.version import VERSION as PARSL_VERSION
@@ -19,7 +20,7 @@ from ipyparallel.serialize import serialize_object
 
 LOOP_SLOWDOWN = 0.0  # in seconds
 HEARTBEAT_CODE = (2 ** 32) - 1
-PKL_HEARTBEAT_CODE = pickle.dumps((2 ** 32) - 1)
+MSGPACK_HEARTBEAT_CODE = msgpack.packb(HEARTBEAT_CODE)
 
 
 class ShutdownRequest(Exception):
@@ -336,6 +337,13 @@ class Interchange(object):
                 logger.warning("Got STATUS_REQUEST")
                 status_request.set()
             else:
+                # Tag the container type once here so the managers don't have
+                # to re-split the task_id for every task they dispatch
+                if isinstance(msg, dict) and 'task_type' not in msg:
+                    try:
+                        msg['task_type'] = msg['task_id'].split(';', 2)[1]
+                    except (AttributeError, IndexError):
+                        pass
                 self.pending_task_queue.put(msg)
                 task_counter += 1
                 logger.debug("[TASK_PULL_THREAD] Fetched task:{}".format(task_counter))
@@ -411,7 +419,7 @@ class Interchange(object):
         logger.debug("[COMMAND] Command Server Starting")
         while not kill_event.is_set():
             try:
-                command_req = self.command_channel.recv_pyobj()
+                command_req = msgpack.unpackb(self.command_channel.recv(), raw=False)
                 logger.debug("[COMMAND] Received command request: {}".format(command_req))
                 if command_req == "OUTSTANDING_C":
                     reply = self.get_total_outstanding()
@@ -442,7 +450,7 @@ class Interchange(object):
                     reply = None
 
                 logger.debug("[COMMAND] Reply: {}".format(reply))
-                self.command_channel.send_pyobj(reply)
+                self.command_channel.send(msgpack.packb(reply))
 
             except zmq.Again:
                 logger.debug("[COMMAND] is alive")
@@ -552,7 +560,7 @@ class Interchange(object):
                     self._ready_manager_queue[manager]['last'] = time.time()
                     if tasks_requested == HEARTBEAT_CODE:
                         logger.debug("[MAIN] Manager {} sends heartbeat".format(manager))
-                        self.task_outgoing.send_multipart([manager, b'', PKL_HEARTBEAT_CODE])
+                        self.task_outgoing.send_multipart([manager, b'', MSGPACK_HEARTBEAT_CODE])
                     else:
                         self._ready_manager_queue[manager]['free_capacity'] = tasks_requested
                         interesting_managers.add(manager)
@@ -573,10 +581,16 @@ class Interchange(object):
                         self._ready_manager_queue[manager]['active']):
                         tasks = self.get_tasks(self._ready_manager_queue[manager]['free_capacity'])
                         if tasks:
-                            self.task_outgoing.send_multipart([manager, b'', pickle.dumps(tasks)])
+                            tids = [t['task_id'] for t in tasks]
+                            # Parallel-array layout: the manager dispatches
+                            # straight from these lists without building a
+                            # dict per task
+                            batch = {'ids': tids,
+                                     'types': [t.get('task_type') for t in tasks],
+                                     'bufs': [t['buffer'] for t in tasks]}
+                            self.task_outgoing.send_multipart([manager, b'', msgpack.packb(batch)])
                             task_count = len(tasks)
                             count += task_count
-                            tids = [t['task_id'] for t in tasks]
                             logger.debug("[MAIN] Sent tasks: {} to {}".format(tids, manager))
                             self._ready_manager_queue[manager]['free_capacity'] -= task_count
                             self._ready_manager_queue[manager]['tasks'].extend(tids)
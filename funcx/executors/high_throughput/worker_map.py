@@ -56,7 +56,8 @@ class WorkerMap(object):
         self.to_die_count[worker_type] -= 1
         self.total_worker_type_counts['slots'] += 1
 
-    def spin_up_workers(self, next_worker_q, address=None, debug=None, uid=None, logdir=None, worker_port=None):
+    def spin_up_workers(self, next_worker_q, address=None, debug=None, uid=None, logdir=None, worker_port=None,
+                        cpu_affinity=None):
         """ Helper function to call 'remove' for appropriate workers in 'new_worker_map'.
 
         Parameters
@@ -73,6 +74,9 @@ class WorkerMap(object):
             Directory in which to write logs
         worker_port: int
             Port at which to connect to the workers.
+        cpu_affinity: set(int)
+            Cores the workers are restricted to, if the manager reserves
+            cores for itself.
 
         Returns
         ---------
@@ -96,7 +100,8 @@ class WorkerMap(object):
                                     address=address, debug=debug,
                                     uid=uid,
                                     logdir=logdir,
-                                    worker_port=worker_port)
+                                    worker_port=worker_port,
+                                    cpu_affinity=cpu_affinity)
                 except Exception:
                     logger.exception("Error spinning up worker! Skipping...")
                     continue
@@ -138,7 +143,8 @@ class WorkerMap(object):
                    debug=None,
                    worker_port=None,
                    logdir=None,
-                   uid=None):
+                   uid=None,
+                   cpu_affinity=None):
         """ Launch the appropriate worker
 
         Parameters
@@ -149,6 +155,8 @@ class WorkerMap(object):
            Valid options are no_container, singularity
         walltime : int
            Walltime in seconds before we check status
+        cpu_affinity : set(int)
+           Cores the worker process is restricted to. Default: inherit
 
         """
 
@@ -171,6 +179,14 @@ class WorkerMap(object):
         else:
             raise NameError("Invalid container launch mode.")
 
+        if cpu_affinity:
+            # The worker would otherwise inherit the manager's (possibly
+            # restricted) affinity mask. taskset rather than a preexec_fn:
+            # running Python between fork and exec is unsafe in a
+            # multithreaded parent and can deadlock the child.
+            modded_cmd = 'taskset -c {} {}'.format(
+                ','.join(str(c) for c in sorted(cpu_affinity)), modded_cmd)
+
         try:
             proc = subprocess.Popen(modded_cmd,
                                     stdout=subprocess.PIPE,
@@ -4,14 +4,28 @@ import zmq
 import time
 import pickle
 import logging
+import msgpack
 
 logger = logging.getLogger(__name__)
 
 
+def _tune_socket(sock):
+    """ Apply tuned options to the client-side pipe sockets.
+
+    Keepalives detect dead peers, and larger kernel buffers keep the
+    task/result streams from hitting the default buffer ceiling at high
+    rates.
+    """
+    sock.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    sock.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 30)
+    sock.setsockopt(zmq.SNDBUF, 8 << 20)
+    sock.setsockopt(zmq.RCVBUF, 8 << 20)
+
+
 class CommandClient(object):
     """ CommandClient
     """
-    def __init__(self, ip_address, port_range):
+    def __init__(self, ip_address, port_range, context=None):
         """
         Parameters
         ----------
@@ -20,10 +34,15 @@ class CommandClient(object):
            IP address of the client (where Parsl runs)
         port_range: tuple(int, int)
            Port range for the comms between client and interchange
+        context: zmq.Context
+           Optional shared ZMQ context. Creating a context per pipe spins up
+           an extra IO thread each time; callers should share one.
 
         """
-        self.context = zmq.Context()
+        self._own_context = context is None
+        self.context = context if context is not None else zmq.Context()
         self.zmq_socket = self.context.socket(zmq.REQ)
+        _tune_socket(self.zmq_socket)
         self.port = self.zmq_socket.bind_to_random_port("tcp://{}".format(ip_address),
                                                         min_port=port_range[0],
                                                         max_port=port_range[1])
@@ -36,20 +55,25 @@ class CommandClient(object):
         We could set copy=False and get slightly better latency but this results
         in ZMQ sockets reaching a broken state once there are ~10k tasks in flight.
         This issue can be magnified if each the serialized buffer itself is larger.
+
+        Command messages are plain strings and replies are JSON-native
+        structures, so msgpack is both faster than pickle here and keeps
+        arbitrary object deserialization off the control plane.
         """
-        self.zmq_socket.send_pyobj(message, copy=True)
-        reply = self.zmq_socket.recv_pyobj()
+        self.zmq_socket.send(msgpack.packb(message), copy=True)
+        reply = msgpack.unpackb(self.zmq_socket.recv(), raw=False)
         return reply
 
     def close(self):
         self.zmq_socket.close()
-        self.context.term()
+        if self._own_context:
+            self.context.term()
 
 
 class TasksOutgoing(object):
     """ Outgoing task queue from the executor to the Interchange
     """
-    def __init__(self, ip_address, port_range):
+    def __init__(self, ip_address, port_range, context=None):
         """
         Parameters
         ----------
@@ -58,11 +82,17 @@ class TasksOutgoing(object):
            IP address of the client (where Parsl runs)
         port_range: tuple(int, int)
            Port range for the comms between client and interchange
+        context: zmq.Context
+           Optional shared ZMQ context
 
         """
-        self.context = zmq.Context()
+        self._own_context = context is None
+        self.context = context if context is not None else zmq.Context()
         self.zmq_socket = self.context.socket(zmq.DEALER)
-        self.zmq_socket.set_hwm(0)
+        # Bounded HWM makes the POLLOUT check in put() meaningful; unlimited
+        # queueing just hides contention until memory runs out
+        self.zmq_socket.set_hwm(4096)
+        _tune_socket(self.zmq_socket)
         self.port = self.zmq_socket.bind_to_random_port("tcp://{}".format(ip_address),
                                                         min_port=port_range[0],
                                                         max_port=port_range[1])
@@ -92,7 +122,10 @@ class TasksOutgoing(object):
         zmq.EAGAIN if the send failed.
 
         """
-        timeout_ms = 0
+        # Exponential backoff capped at 8 ms: converges in ~log2(N) poll
+        # calls instead of busy-polling with near-zero timeouts, while the
+        # cap keeps the worst-case latency after a drain small
+        timeout_ms = 1
         current_wait = 0
         logger.info("Putting task into queue")
         while current_wait < max_timeout:
@@ -102,9 +135,9 @@ class TasksOutgoing(object):
                 self.zmq_socket.send_pyobj(message, copy=True)
                 return
             else:
-                timeout_ms += 1
                 logger.debug("Not sending due to full zmq pipe, timeout: {} ms".format(timeout_ms))
             current_wait += timeout_ms
+            timeout_ms = min(timeout_ms * 2, 8)
 
         # Send has failed.
         logger.debug("Remote side has been unresponsive for {}".format(current_wait))
@@ -112,14 +145,15 @@ class TasksOutgoing(object):
 
     def close(self):
         self.zmq_socket.close()
-        self.context.term()
+        if self._own_context:
+            self.context.term()
 
 
 class ResultsIncoming(object):
     """ Incoming results queue from the Interchange to the executor
     """
 
-    def __init__(self, ip_address, port_range):
+    def __init__(self, ip_address, port_range, context=None):
         """
         Parameters
         ----------
@@ -128,11 +162,15 @@ class ResultsIncoming(object):
            IP address of the client (where Parsl runs)
         port_range: tuple(int, int)
            Port range for the comms between client and interchange
+        context: zmq.Context
+           Optional shared ZMQ context
 
         """
-        self.context = zmq.Context()
+        self._own_context = context is None
+        self.context = context if context is not None else zmq.Context()
         self.results_receiver = self.context.socket(zmq.DEALER)
-        self.results_receiver.set_hwm(0)
+        self.results_receiver.set_hwm(4096)
+        _tune_socket(self.results_receiver)
         self.port = self.results_receiver.bind_to_random_port("tcp://{}".format(ip_address),
                                                               min_port=port_range[0],
                                                               max_port=port_range[1])
@@ -147,4 +185,5 @@ class ResultsIncoming(object):
 
     def close(self):
         self.results_receiver.close()
-        self.context.term()
+        if self._own_context:
+            self.context.term()